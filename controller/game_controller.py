@@ -27,6 +27,9 @@ class GameController:
         self.view = view
         self.test_mode = test_mode
         self.test_board = test_board
+        self._pending = set()
+        self._flags_dirty = False
+        self._flush_scheduled = False
 
     def reveal_cell(self, x, y):
         """
@@ -36,25 +39,27 @@ class GameController:
             - x and y must be valid board coordinates
             - Cell at (x,y) must not be revealed or flagged
         Postcondition:
-            - Cell is revealed and view is updated
+            - Cell is revealed and its view update is queued
             - Game state is updated if win/loss condition met
             - Adjacent empty cells are revealed if applicable
+            - Returns list of (x, y) coordinates of the newly revealed cells
         Invariant:
             - Game state remains consistent
         
         Maps to: onClick() in original minesweeper.py
         """
-        result = self.model.reveal_cell(x, y)
-        self.view.update_cell(x, y)
-
-        cell = self.model.board[x][y]
-        if cell.adjacent_mines == 0:
-            self.model.reveal_empty_cells(x, y, self.view.update_cell)
+        result, revealed = self.model.reveal_cell(x, y)
+        self._pending.update(revealed)
 
         if result == "LOSS":
+            self.flush_view()
             self.view.display_game_over(False)
         elif result == "WIN" or result == "WIN_TREASURE":
+            self.flush_view()
             self.view.display_game_over(result)
+        else:
+            self._schedule_flush()
+        return revealed
 
     def toggle_flag(self, x, y):
         """
@@ -65,16 +70,60 @@ class GameController:
             - Cell at (x,y) must not be revealed
         Postcondition:
             - Flag state is toggled
-            - View is updated to reflect new flag state
-            - Flag counter is updated
+            - Cell and flag counter view updates are queued
         Invariant:
             - Flag count remains consistent with board state
         
         Maps to: onRightClick() in original minesweeper.py
         """
         self.model.toggle_flag(x, y)
-        self.view.update_cell(x, y)
-        self.view.update_flags_label()
+        self._pending.add((x, y))
+        self._flags_dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """
+        Schedules a single view flush for all queued updates.
+        
+        Precondition:
+            - View must be initialized
+        Postcondition:
+            - GUI views flush once when Tk is next idle, so a burst of
+              events results in one redraw pass
+            - Other views are flushed immediately
+        Invariant:
+            - At most one flush is scheduled at a time
+        
+        Maps to: refreshLabels() in original minesweeper.py
+        """
+        if not hasattr(self.view, "tk"):
+            self.flush_view()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.view.tk.after_idle(self.flush_view)
+
+    def flush_view(self):
+        """
+        Applies all queued cell and flag counter updates to the view.
+        
+        Precondition:
+            - View must be initialized
+        Postcondition:
+            - Every queued cell is redrawn once
+            - Flag counter is refreshed if a flag changed
+            - Update queue is empty
+        Invariant:
+            - View matches model state after the flush
+        
+        Maps to: refreshLabels() in original minesweeper.py
+        """
+        self._flush_scheduled = False
+        if self._pending:
+            pending, self._pending = self._pending, set()
+            self.view.update_cells(pending)
+        if self._flags_dirty:
+            self._flags_dirty = False
+            self.view.update_flags_label()
 
     def restart_game(self):
         """
@@ -92,6 +141,8 @@ class GameController:
         Maps to: restart() in original minesweeper.py
         """
         self.model.reset_game()
+        self._pending.clear()
+        self._flags_dirty = False
         if self.test_mode:
             self.model.initialize_test_board(self.test_board)
         else:
@@ -1,16 +1,50 @@
+import argparse
 import os
 from model.game_model import GameModel
 from controller.game_controller import GameController
-from view.gui_view import GUIView
-from view.text_view import TextView
-from tkinter import Tk
 from test_validator import TestValidator
 
 os.environ['TK_SILENCE_DEPRECATION'] = '1'
 
-def main():
+DIFFICULTY_MAP = {
+    '1': 'beginner',
+    '2': 'intermediate',
+    '3': 'expert'
+}
+
+MODE_MAP = {
+    'gui': '1',
+    'text': '2'
+}
+
+def parse_args(argv=None):
+    """
+    Parses the optional command line settings for the game.
+    
+    Precondition:
+        - argv must be None or a list of strings
+    Postcondition:
+        - Returns namespace with difficulty, mode and test_board (None when omitted)
+        - Exits with a usage error if both --difficulty and --test-board are given
+    Invariant:
+        - Omitted settings are left to the interactive prompts
+    
+    Maps to: main() setup in original minesweeper.py
+    """
+    parser = argparse.ArgumentParser(description="Minesweeper")
+    board = parser.add_mutually_exclusive_group()
+    board.add_argument("--difficulty", choices=list(DIFFICULTY_MAP.values()),
+                       help="board difficulty for normal mode")
+    board.add_argument("--test-board", metavar="FILE",
+                       help="CSV test board to play in testing mode")
+    parser.add_argument("--mode", choices=list(MODE_MAP),
+                        help="game interface to use")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """
     Main function to initialize and start the Minesweeper game.
+    Settings given on the command line skip their interactive prompts.
     
     Precondition:
         - All required modules must be imported
@@ -25,21 +59,32 @@ def main():
     
     Maps to: main() and __init__ setup in original minesweeper.py
     """
-    # Ask if user wants to enter testing mode with test board validation
-    while True:
-        print("Would you like to enter testing mode? (yes/no)")
-        user_input = input().strip().lower()
-        if user_input in ['yes', 'no']:
-            testing_mode = (user_input == 'yes')
-            break
-        else:
-            print("Invalid input. Please enter 'yes' or 'no'.")
+    args = parse_args(argv)
+
+    test_board = None
+    if args.test_board:
+        testing_mode = True
+        test_board = TestValidator.read_test_board(args.test_board)
+        if test_board is None:
+            testing_mode = False
+            print("Exiting testing mode. You are now in normal mode of the game.")
+    elif args.difficulty:
+        testing_mode = False
+    else:
+        # Ask if user wants to enter testing mode with test board validation
+        while True:
+            print("Would you like to enter testing mode? (yes/no)")
+            user_input = input().strip().lower()
+            if user_input in ['yes', 'no']:
+                testing_mode = (user_input == 'yes')
+                break
+            else:
+                print("Invalid input. Please enter 'yes' or 'no'.")
 
     if not testing_mode:
         print("You have selected normal mode of the game.")
 
-    test_board = None
-    if testing_mode:
+    if testing_mode and test_board is None:
         while test_board is None:
             print("Enter test board filename (CSV format):")
             filename = input().strip()
@@ -74,35 +119,39 @@ def main():
     if testing_mode and test_board:
         game_model = GameModel("beginner")
         game_model.initialize_test_board(test_board)
+    elif args.difficulty:
+        game_model = GameModel(args.difficulty)
+        game_model.initialize_board()
     else:
         print("Select difficulty:")
         print("1. Beginner\t\t2. Intermediate\t\t3. Expert")
-        difficulty_map = {
-            '1': 'beginner',
-            '2': 'intermediate',
-            '3': 'expert'
-        }
         while True:
             difficulty_level = input("Enter difficulty (1/2/3): ").strip()
-            if difficulty_level in difficulty_map:
-                difficulty = difficulty_map[difficulty_level]
+            if difficulty_level in DIFFICULTY_MAP:
+                difficulty = DIFFICULTY_MAP[difficulty_level]
                 break
             else:
                 print("Invalid input. Please enter '1', '2', or '3'.")
         game_model = GameModel(difficulty)
         game_model.initialize_board()
 
-    print("Select game mode:")
-    print("1. GUI")
-    print("2. Text")
-    while True:
-        mode = input("Enter mode (1/2): ").strip()
-        if mode in ['1', '2']:
-            break
-        else:
-            print("Invalid input. Please enter '1' for GUI or '2' for Text mode.")
+    if args.mode:
+        mode = MODE_MAP[args.mode]
+    else:
+        print("Select game mode:")
+        print("1. GUI")
+        print("2. Text")
+        while True:
+            mode = input("Enter mode (1/2): ").strip()
+            if mode in ['1', '2']:
+                break
+            else:
+                print("Invalid input. Please enter '1' for GUI or '2' for Text mode.")
 
+    # Only the selected interface is imported, so text mode never loads Tk.
     if mode == '1':
+        from tkinter import Tk
+        from view.gui_view import GUIView
         tk = Tk()
         tk.title("Minesweeper")
         controller = GameController(game_model, None, test_board, testing_mode)
@@ -110,6 +159,7 @@ def main():
         controller.view = gui_view
         tk.mainloop()
     elif mode == '2':
+        from view.text_view import TextView
         controller = GameController(game_model, None, test_board, testing_mode)
         text_view = TextView(game_model, controller)
         controller.view = text_view
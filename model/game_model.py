@@ -1,84 +1,17 @@
-from random import sample, randint
-from datetime import datetime
+from functools import lru_cache
+from random import Random
+from time import monotonic
 
+# Bit flags packed into GameModel.state, one byte per cell.
+MINE = 1
+FLAG = 2
+REVEAL = 4
+TREASURE = 8
 
-class Cell:
-    """
-    Represents a single cell on the Minesweeper board.
-    Contains information about:
-    - Mine presence
-    - Flag status
-    - Revealed status
-    - Adjacent mine count
-    - Treasure presence
-    - Position coordinates
-    
-    Invariants:
-        - A cell cannot be both revealed and flagged
-        - A cell cannot be both a mine and a treasure
-        - Adjacent mines count must be between 0 and 8
-        - Coordinates must be non-negative when set
-    """
-    def __init__(self, is_mine=False, has_treasure=False, x=None, y=None):
-        """
-        Initializes a new cell with specified properties.
-        
-        Precondition:
-            - x and y must be None or non-negative integers
-            - is_mine and has_treasure cannot both be True
-        Postcondition:
-            - Cell is initialized with default state (not revealed, not flagged)
-            - Mine and treasure status are set as specified
-            - Coordinates are set if provided
-        Invariant:
-            - Cell maintains valid state combinations
-        
-        Maps to: setup() tile initialization in original minesweeper.py
-        """
-        self.is_mine = is_mine
-        self.is_flagged = False
-        self.is_revealed = False
-        self.adjacent_mines = 0
-        self.has_treasure = has_treasure
-        self.x = x
-        self.y = y
-
-    def reveal(self):
-        """
-        Marks the cell as revealed if not flagged.
-        
-        Precondition:
-            - Cell must be initialized
-        Postcondition:
-            - Cell is revealed if not flagged
-            - No change if cell is flagged
-        Invariant:
-            - Flagged cells cannot be revealed
-            - Revealed state cannot be reversed
-        
-        Maps to: onClick() tile state change in original minesweeper.py
-        """
-        if not self.is_flagged:
-            self.is_revealed = True
+_NEIGHBOR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1),
+                     (0, -1),           (0, 1),
+                     (1, -1),  (1, 0),  (1, 1))
 
-    def toggle_flag(self):
-        """
-        Toggles the flag state of the cell if not revealed.
-        
-        Precondition:
-            - Cell must be initialized
-            - Cell must not be revealed
-        Postcondition:
-            - Flag state is toggled if cell is not revealed
-            - No change if cell is revealed
-        Invariant:
-            - Revealed cells cannot be flagged
-            - Flag state can only be True or False
-        
-        Maps to: onRightClick() flag toggling in original minesweeper.py
-        """
-        if not self.is_revealed:
-            self.is_flagged = not self.is_flagged
 
 class GameModel:
     """
@@ -115,7 +48,10 @@ class GameModel:
         
         Maps to: __init__ and setup() in original minesweeper.py
         """
-        self.board = []
+        self.state = bytearray()
+        self.adjacent_mines = bytearray()
+        self._blank = b""
+        self._neighbors = ()
         self.difficulty = self.DIFFICULTY_TO_LEVEL.get(difficulty)
         if not self.difficulty:
             raise ValueError(f"Unknown difficulty level: {difficulty}")
@@ -124,6 +60,42 @@ class GameModel:
         self.board_size = (0, 0)
         self.start_time = None
         self.clicked_count = 0
+        self.unrevealed_count = 0
+        self.unrevealed_non_mines = 0
+        self.flagged_mines = 0
+        self.wrong_flags = 0
+        self._rng = Random()
+
+    def _allocate_board(self, rows, cols):
+        """
+        Allocates empty state arrays for a board of the given size.
+        When the size is unchanged (e.g. on restart) the existing arrays
+        are cleared and reused instead of being reallocated.
+
+        Precondition:
+            - rows and cols must be positive integers
+        Postcondition:
+            - state and adjacent_mines hold rows * cols zeroed entries
+            - Win condition counters describe a fully hidden, unflagged board
+        Invariant:
+            - Cell at (x, y) maps to array index x * cols + y
+
+        Maps to: setup() in original minesweeper.py
+        """
+        size = rows * cols
+        if self.board_size == (rows, cols) and len(self.state) == size:
+            self.state[:] = self._blank
+            self.adjacent_mines[:] = self._blank
+        else:
+            self.board_size = (rows, cols)
+            self._blank = bytes(size)
+            self.state = bytearray(size)
+            self.adjacent_mines = bytearray(size)
+            self._neighbors = self._build_neighbors(rows, cols)
+        self.unrevealed_count = size
+        self.unrevealed_non_mines = size
+        self.flagged_mines = 0
+        self.wrong_flags = 0
 
     def initialize_test_board(self, test_board):
         """
@@ -143,21 +115,21 @@ class GameModel:
         """
         rows = len(test_board)
         cols = len(test_board[0])
-        self.board_size = (rows, cols)
-        self.board = [[Cell(x=i, y=j) for j in range(cols)] for i in range(rows)]
-        
+        self._allocate_board(rows, cols)
+
         self.mines_count = 0
-        for i in range(rows):
-            for j in range(cols):
-                if test_board[i][j] == 1:
-                    self.board[i][j].is_mine = True
+        index = 0
+        for board_row in test_board:
+            for value in board_row:
+                if value == 1:
+                    self.state[index] = MINE
                     self.mines_count += 1
-                elif test_board[i][j] == 2:
-                    self.board[i][j].has_treasure = True
-        
-        for x in range(rows):
-            for y in range(cols):
-                self.board[x][y].adjacent_mines = self._calculate_adjacent_mines(x, y)
+                elif value == 2:
+                    self.state[index] = TREASURE
+                index += 1
+        self.unrevealed_non_mines -= self.mines_count
+
+        self._calculate_adjacent_mines()
 
     def initialize_board(self):
         """
@@ -176,81 +148,84 @@ class GameModel:
         Maps to: setup() in original minesweeper.py
         """
         row, col = self.difficulty['board_size']
-        self.board_size = self.difficulty['board_size']
-        self.board = [[Cell(x=i, y=j) for j in range(col)] for i in range(row)]
-        self.mines_count = randint(*self.difficulty['mines_range'])
+        self._allocate_board(row, col)
+        state = self.state
+        self.mines_count = self._rng.randint(*self.difficulty['mines_range'])
         num_mines = self.mines_count
 
-        mine_positions = sample(range(row * col), num_mines)
+        mine_positions = self._rng.sample(range(row * col), num_mines)
         for pos in mine_positions:
-            x, y = divmod(pos, col)
-            self.board[x][y].is_mine = True
+            state[pos] = MINE
+        self.unrevealed_non_mines -= num_mines
 
         if num_mines > 1:
-            treasures_count = randint(0, num_mines - 1)
+            treasures_count = self._rng.randint(0, num_mines - 1)
         else:
             treasures_count = 0
 
-        available_positions = [pos for pos in range(row * col) if pos not in mine_positions]
+        available_positions = [pos for pos in range(row * col) if not state[pos] & MINE]
         if treasures_count > 0:
-            treasure_positions = sample(available_positions, treasures_count)
+            treasure_positions = self._rng.sample(available_positions, treasures_count)
             for pos in treasure_positions:
-                x, y = divmod(pos, col)
-                self.board[x][y].has_treasure = True
+                state[pos] = TREASURE
 
-        for x in range(row):
-            for y in range(col):
-                self.board[x][y].adjacent_mines = self._calculate_adjacent_mines(x, y)
+        self._calculate_adjacent_mines()
 
-    def _calculate_adjacent_mines(self, x, y):
+    def _calculate_adjacent_mines(self):
         """
-        Calculates the number of adjacent mines for a cell.
+        Calculates the number of adjacent mines for every cell in one pass.
+        Every cell is scanned once, and only mine cells add one to the
+        count of each of their neighbors.
         
         Precondition:
-            - x and y must be valid board coordinates
-            - Board must be initialized
+            - Board must be initialized with mines placed
+            - adjacent_mines must be zeroed
         Postcondition:
-            - Returns count of adjacent mines (0-8)
+            - adjacent_mines holds the count of adjacent mines (0-8) for each cell
         Invariant:
             - Count cannot exceed 8
             - Count cannot be negative
         
         Maps to: getNeighbors() mine counting in original minesweeper.py
         """
-        count = 0
-        for neighbor in self.get_neighbors(x, y):
-            if neighbor.is_mine:
-                count += 1
-        return count
+        neighbors = self._neighbors
+        adjacent_mines = self.adjacent_mines
+        for index, cell_state in enumerate(self.state):
+            if cell_state & MINE:
+                for neighbor in neighbors[index]:
+                    adjacent_mines[neighbor] += 1
 
-    def get_neighbors(self, x, y):
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_neighbors(rows, cols):
         """
-        Returns a list of neighboring cells for given coordinates.
+        Precomputes the neighbor indices of every cell on a board.
+        Tables are cached per board size and shared between games.
         
         Precondition:
-            - x and y must be valid board coordinates
-            - Board must be initialized
+            - rows and cols must be positive integers
         Postcondition:
-            - Returns list of valid neighboring Cell objects
+            - Returns a tuple with one tuple of neighbor indices per flat index
         Invariant:
-            - Number of neighbors ≤ 8
-            - All returned cells are valid board positions
+            - Board topology is fixed for a given size, so the table never changes
         
         Maps to: getNeighbors() in original minesweeper.py
         """
-        rows, cols = self.board_size
         neighbors = []
-        for dx, dy in [(-1, -1), (-1, 0), (-1, 1), 
-                       (0, -1),          (0, 1), 
-                       (1, -1),  (1, 0), (1, 1)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < rows and 0 <= ny < cols:
-                neighbors.append(self.board[nx][ny])
-        return neighbors
+        for x in range(rows):
+            for y in range(cols):
+                cell_neighbors = []
+                for dx, dy in _NEIGHBOR_OFFSETS:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < rows and 0 <= ny < cols:
+                        cell_neighbors.append(nx * cols + ny)
+                neighbors.append(tuple(cell_neighbors))
+        return tuple(neighbors)
 
     def reveal_cell(self, x, y):
         """
         Reveals a cell and handles game state changes.
+        Revealing an empty safe cell also flood-fills its connected empty region.
         
         Precondition:
             - x and y must be valid board coordinates
@@ -258,6 +233,8 @@ class GameModel:
         Postcondition:
             - Cell is revealed if not flagged
             - Game state is updated based on reveal result
+            - Returns (result, revealed) where result is "WIN", "WIN_TREASURE",
+              "LOSS" or False and revealed lists the (x, y) of every newly revealed cell
         Invariant:
             - Game state remains valid
             - Clicked count only increases for valid reveals
@@ -265,48 +242,69 @@ class GameModel:
         Maps to: onClick() in original minesweeper.py
         """
         if self.start_time is None:
-            self.start_time = datetime.now()
+            self.start_time = monotonic()
 
-        cell = self.board[x][y]
-        if cell.is_revealed or cell.is_flagged:
-            return False
+        index = x * self.board_size[1] + y
+        if self.state[index] & (REVEAL | FLAG):
+            return False, []
 
-        cell.reveal()
+        self.state[index] |= REVEAL
         self.clicked_count += 1
+        self.unrevealed_count -= 1
+        revealed = [(x, y)]
 
-        if cell.has_treasure:
-            return "WIN_TREASURE"
+        if self.state[index] & TREASURE:
+            self.unrevealed_non_mines -= 1
+            return "WIN_TREASURE", revealed
 
-        if cell.is_mine:
-            return "LOSS"
+        if self.state[index] & MINE:
+            return "LOSS", revealed
 
-        return self.check_win_condition()
+        self.unrevealed_non_mines -= 1
+        if self.adjacent_mines[index] == 0:
+            revealed.extend(self.reveal_empty_cells(x, y))
 
-    def reveal_empty_cells(self, x, y, update_view):
+        return self.check_win_condition(), revealed
+
+    def reveal_empty_cells(self, x, y):
         """
-        Reveals empty cells recursively and updates the view.
+        Reveals connected empty cells breadth-first.
+        Each pass expands the whole frontier of empty cells by one ring of
+        neighbors; numbered cells on the border are revealed but not expanded.
         
         Precondition:
             - x and y must be valid board coordinates
-            - update_view must be a valid callback function
         Postcondition:
             - All connected empty cells are revealed
-            - View is updated for each revealed cell
+            - Returns list of (x, y) coordinates of the newly revealed cells
         Invariant:
             - Treasures remain hidden
             - Flagged cells remain unchanged
         
         Maps to: clearSurroundingTiles() in original minesweeper.py
         """
-        stack = [(x, y)]
-        while stack:
-            cx, cy = stack.pop()
-            for neighbor in self.get_neighbors(cx, cy):
-                if not neighbor.is_revealed and not neighbor.is_flagged and not neighbor.has_treasure:
-                    neighbor.reveal()
-                    update_view(neighbor.x, neighbor.y)
-                    if neighbor.adjacent_mines == 0:
-                        stack.append((neighbor.x, neighbor.y))
+        cols = self.board_size[1]
+        state = self.state
+        neighbors = self._neighbors
+        adjacent_mines = self.adjacent_mines
+        blocked = REVEAL | FLAG | TREASURE
+        revealed = []
+        frontier = [x * cols + y]
+        while frontier:
+            next_frontier = []
+            for index in frontier:
+                for neighbor in neighbors[index]:
+                    if state[neighbor] & blocked:
+                        continue
+                    state[neighbor] |= REVEAL
+                    revealed.append(divmod(neighbor, cols))
+                    if adjacent_mines[neighbor] == 0:
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        self.unrevealed_count -= len(revealed)
+        self.unrevealed_non_mines -= len(revealed)
+        return revealed
 
     def toggle_flag(self, x, y):
         """
@@ -317,17 +315,22 @@ class GameModel:
             - Board must be initialized
         Postcondition:
             - Cell flag state is toggled if not revealed
-            - Flag count is updated accordingly
+            - Flag count and win condition counters are updated accordingly
         Invariant:
             - Flag count matches number of flagged cells
             - Revealed cells cannot be flagged
         
         Maps to: onRightClick() in original minesweeper.py
         """
-        cell = self.board[x][y]
-        if not cell.is_revealed:
-            cell.toggle_flag()
-            self.flags_count += 1 if cell.is_flagged else -1
+        index = x * self.board_size[1] + y
+        if not self.state[index] & REVEAL:
+            self.state[index] ^= FLAG
+            step = 1 if self.state[index] & FLAG else -1
+            self.flags_count += step
+            if self.state[index] & MINE:
+                self.flagged_mines += step
+            else:
+                self.wrong_flags += step
 
     def check_win_condition(self):
         """
@@ -344,22 +347,13 @@ class GameModel:
         
         Maps to: gameOver() win condition check in original minesweeper.py
         """
-        unrevealed_count = 0
-        flagged_mines = 0
-
-        for row in self.board:
-            for cell in row:
-                if not cell.is_revealed:
-                    unrevealed_count += 1
-                if cell.is_mine and cell.is_flagged:
-                    flagged_mines += 1
-                if not cell.is_mine and cell.is_flagged:
-                    return False
-        
-        if unrevealed_count == self.mines_count or flagged_mines == self.mines_count:
+        if self.wrong_flags:
+            return False
+
+        if self.unrevealed_count == self.mines_count or self.flagged_mines == self.mines_count:
             return "WIN"
         
-        if all(cell.is_revealed or cell.is_mine for row in self.board for cell in row):
+        if self.unrevealed_non_mines == 0:
             return "WIN"
 
         return False
@@ -373,15 +367,20 @@ class GameModel:
         Postcondition:
             - All game state variables reset to initial values
             - Board cleared and ready for new game
+            - Board arrays are kept for reuse by the next initialization
         Invariant:
             - All counters are non-negative
             - Board size matches difficulty settings
         
         Maps to: restart() in original minesweeper.py
         """
-        self.board = []
+        self.state[:] = self._blank
+        self.adjacent_mines[:] = self._blank
         self.mines_count = 0
         self.flags_count = 0
-        self.board_size = (0, 0)
         self.start_time = None
         self.clicked_count = 0
+        self.unrevealed_count = 0
+        self.unrevealed_non_mines = 0
+        self.flagged_mines = 0
+        self.wrong_flags = 0
@@ -1,4 +1,13 @@
 import csv
+from hashlib import blake2b
+
+# Validated boards keyed by a digest of the file contents they were read from.
+_board_cache = {}
+_MAX_CACHED_BOARDS = 4096
+
+# Boards (as tuples of row tuples) already known to pass validate_board.
+_valid_boards = set()
+_MAX_VALID_BOARDS = 4096
 
 class TestValidator:
     """
@@ -47,28 +56,34 @@ class TestValidator:
         Postcondition:
             - Returns (True, board_data) if valid
             - Returns (False, None) if invalid with appropriate error message
+            - Boards that passed before are accepted from a cache without re-validation
         Invariant:
             - Validation criteria remain constant
             - Board structure remains unchanged during validation
+            - Only valid boards are cached, so error messages are always reported
         
         Maps to: setup() board initialization in original minesweeper.py
         """
-        if len(board_data) != 8 or any(len(row) != 8 for row in board_data):
+        key = tuple(map(tuple, board_data))
+        if key in _valid_boards:
+            return True, board_data
+
+        if len(board_data) != 8 or set(map(len, board_data)) != {8}:
             print("Invalid board dimensions. Board must be 8x8.")
             return False, None
 
-        mine_positions = []
-        treasure_count = 0
+        # Classify the 64 cells with bulk list/set operations instead of a
+        # per-cell branch ladder.
+        cells = [value for row in board_data for value in row]
+
+        if not set(cells) <= {0, 1, 2}:
+            index = next(i for i, value in enumerate(cells) if value not in (0, 1, 2))
+            x, y = divmod(index, 8)
+            print(f"Invalid value {cells[index]} at ({x}, {y}). Must be 0, 1, or 2.")
+            return False, None
 
-        for x, row in enumerate(board_data):
-            for y, value in enumerate(row):
-                if value == 1:
-                    mine_positions.append((x, y))
-                elif value == 2:
-                    treasure_count += 1
-                elif value != 0:
-                    print(f"Invalid value {value} at ({x}, {y}). Must be 0, 1, or 2.")
-                    return False, None
+        mine_positions = [divmod(index, 8) for index, value in enumerate(cells) if value == 1]
+        treasure_count = cells.count(2)
 
         if treasure_count > 9:
             print("Invalid number of treasures. Must be no more than 9.")
@@ -77,6 +92,9 @@ class TestValidator:
         if not self.validate_mine_positions(mine_positions):
             return False, None
 
+        if len(_valid_boards) >= _MAX_VALID_BOARDS:
+            _valid_boards.clear()
+        _valid_boards.add(key)
         return True, board_data
 
     def validate_mine_positions(self, mine_positions):
@@ -103,48 +121,48 @@ class TestValidator:
             print("Insufficient mines. There must be at least 8 mines.")
             return False
 
+        # Pick a diagonal mine first, then fill greedily with mines on
+        # unused rows and columns. Since every selected mine has its own row
+        # and column, no two of them can be adjacent by row or column.
         first_eight_mines = []
-        rows = set()
-        cols = set()
-        diagonal_found = False
-
-        for x, y in mine_positions:
-            if x not in rows and y not in cols:
-                first_eight_mines.append((x, y))
-                rows.add(x)
-                cols.add(y)
-                if x == y:
-                    diagonal_found = True
-                if len(first_eight_mines) == 8:
-                    break
-
-        if not diagonal_found:
+        for diagonal_mine in [(x, y) for x, y in mine_positions if x == y]:
+            first_eight_mines = [diagonal_mine]
+            rows = {diagonal_mine[0]}
+            cols = {diagonal_mine[1]}
+
             for x, y in mine_positions:
-                if x == y and (x, y) not in first_eight_mines:
-                    first_eight_mines[-1] = (x, y)
-                    diagonal_found = True
-                    break
+                if x not in rows and y not in cols:
+                    first_eight_mines.append((x, y))
+                    rows.add(x)
+                    cols.add(y)
+                    if len(first_eight_mines) == 8:
+                        break
+
+            if len(first_eight_mines) == 8:
+                break
 
-        if len(first_eight_mines) < 8 or not diagonal_found:
+        if len(first_eight_mines) < 8:
             print("Error: Unable to select 8 mines with unique rows and columns, with one on the diagonal.")
             return False
 
-        for i, (x1, y1) in enumerate(first_eight_mines):
-            for j, (x2, y2) in enumerate(first_eight_mines):
-                if i != j and (
-                    (abs(x1 - x2) == 1 and y1 == y2) or (x1 == x2 and abs(y1 - y2) == 1)
-                ):
-                    print(f"Mine placement error: ({x1}, {y1}) is adjacent to ({x2}, {y2}) by row or column.")
-                    return False
+        first_eight_set = set(first_eight_mines)
+
+        remaining_mines = [mine for mine in mine_positions if mine not in first_eight_set]
 
-        remaining_mines = [mine for mine in mine_positions if mine not in first_eight_mines]
+        # Every square touching one of the first eight mines, including the mines themselves.
+        near_first_eight = {
+            (x + dx, y + dy)
+            for x, y in first_eight_mines
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+        }
 
         for ninth_mine in remaining_mines:
             x9, y9 = ninth_mine
 
-            adjacent_to_first_eight = any(
-                (abs(x9 - x) == 1 and y9 == y) or (x9 == x and abs(y9 - y) == 1)
-                for x, y in first_eight_mines
+            adjacent_to_first_eight = (
+                (x9 - 1, y9) in first_eight_set or (x9 + 1, y9) in first_eight_set or
+                (x9, y9 - 1) in first_eight_set or (x9, y9 + 1) in first_eight_set
             )
 
             if not adjacent_to_first_eight:
@@ -155,9 +173,9 @@ class TestValidator:
                     continue
 
                 x10, y10 = tenth_mine
-                is_isolated = not any(
-                    (abs(x10 - x) <= 1 and abs(y10 - y) <= 1)
-                    for x, y in first_eight_mines + [ninth_mine]
+                is_isolated = (
+                    tenth_mine not in near_first_eight and
+                    not (abs(x10 - x9) <= 1 and abs(y10 - y9) <= 1)
                 )
 
                 if is_isolated:
@@ -170,6 +188,9 @@ class TestValidator:
     def read_test_board(filename):
         """
         Reads and validates a test board from a CSV file.
+        Boards that passed validation are cached by a hash of the file
+        contents, so re-reading an unchanged file skips parsing and validation.
+        The cache is cleared once it holds _MAX_CACHED_BOARDS entries.
         
         Precondition:
             - filename must be a string
@@ -185,9 +206,16 @@ class TestValidator:
         Maps to: setup() board initialization in original minesweeper.py
         """
         try:
-            with open(filename, 'r') as file:
-                reader = csv.reader(file)
-                board = [[int(cell) for cell in row] for row in reader]
+            with open(filename, 'rb') as file:
+                data = file.read()
+
+            key = blake2b(data, digest_size=16).hexdigest()
+            if key in _board_cache:
+                print("Board validation successful!")
+                return [row[:] for row in _board_cache[key]]
+
+            reader = csv.reader(data.decode().splitlines())
+            board = [list(map(int, row)) for row in reader]
 
             if len(board) != 8 or any(len(row) != 8 for row in board):
                 print("Invalid board dimensions. Must be 8x8.")
@@ -198,6 +226,9 @@ class TestValidator:
                 print("Board does not meet test criteria.")
                 return None
 
+            if len(_board_cache) >= _MAX_CACHED_BOARDS:
+                _board_cache.clear()
+            _board_cache[key] = [row[:] for row in board]
             return board
         except Exception as e:
             print(f"Error reading test board: {e}")
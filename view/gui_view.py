@@ -1,5 +1,55 @@
+from time import monotonic
 from tkinter import *
 from tkinter import messagebox
+from model.game_model import MINE, FLAG, REVEAL, TREASURE
+
+# Image attribute name for each adjacent mine count (index 0 is unused).
+_NUMBER_IMAGES = (None,) + tuple(f"number_{i}" for i in range(1, 9))
+
+class _ImageStore:
+    """
+    Tile images loaded on first use and then kept as plain attributes.
+    
+    Invariants:
+        - Each image file is loaded at most once
+        - Attribute names match the keys of the path mapping
+    """
+    def __init__(self, paths):
+        """
+        Initializes the store without loading any image.
+        
+        Precondition:
+            - paths must map attribute names to image file paths
+        Postcondition:
+            - No PhotoImage has been created yet
+        Invariant:
+            - Path mapping remains constant
+        
+        Maps to: __init__ image loading in original minesweeper.py
+        """
+        self._paths = paths
+
+    def __getattr__(self, name):
+        """
+        Loads the named image on first access and caches it on the instance.
+        
+        Precondition:
+            - A Tk root must exist
+        Postcondition:
+            - Returns the PhotoImage for name; later reads are direct attribute reads
+            - Raises AttributeError for unknown names
+        Invariant:
+            - Each image file is loaded at most once
+        
+        Maps to: __init__ image loading in original minesweeper.py
+        """
+        try:
+            path = self._paths[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        image = PhotoImage(file=path)
+        setattr(self, name, image)
+        return image
 
 class GUIView:
     """
@@ -39,18 +89,26 @@ class GUIView:
 
         self.frame = Frame(self.tk)
         self.frame.pack()
+        # Virtual events are application-wide, so the flag gestures only need
+        # to be registered once rather than bound separately on every button.
+        self.tk.event_add("<<Flag>>", "<Button-2>", "<Button-3>", "<Control-Button-1>")
+        self._buttons = []
         self.timer_running = False
         self.start_timer()
 
-        self.images = {
-            "plain": PhotoImage(file="images/tile_plain.gif"),
-            "clicked": PhotoImage(file="images/tile_clicked.gif"),
-            "mine": PhotoImage(file="images/tile_mine.gif"),
-            "flag": PhotoImage(file="images/tile_flag.gif"),
-            "wrong": PhotoImage(file="images/tile_wrong.gif"),
-            "treasure": PhotoImage(file="images/tile_treasure.gif"),
-            "numbers": [PhotoImage(file=f"images/tile_{i}.gif") for i in range(1, 9)]
+        # Images are loaded lazily; tiles such as "wrong" or high numbers
+        # are often never shown in a game.
+        image_paths = {
+            "plain": "images/tile_plain.gif",
+            "clicked": "images/tile_clicked.gif",
+            "mine": "images/tile_mine.gif",
+            "flag": "images/tile_flag.gif",
+            "wrong": "images/tile_wrong.gif",
+            "treasure": "images/tile_treasure.gif",
         }
+        for i in range(1, 9):
+            image_paths[_NUMBER_IMAGES[i]] = f"images/tile_{i}.gif"
+        self.images = _ImageStore(image_paths)
 
         self.labels = {
             "time": Label(self.frame, text="00:00:00"),
@@ -77,20 +135,52 @@ class GUIView:
             - Mines label is updated
         Invariant:
             - Button grid matches model board dimensions
+            - _buttons[x * cols + y] is the button for cell (x, y)
         
         Maps to: setup() in original minesweeper.py
         """
-        for x, row in enumerate(self.model.board):
-            for y, cell in enumerate(row):
-                button = Button(self.frame, image=self.images["plain"])
-                button.bind("<Button-1>", lambda event, x=x, y=y: self.controller.reveal_cell(x, y))
-                button.bind("<Button-2>", lambda event, x=x, y=y: self.controller.toggle_flag(x, y))
-                button.bind("<Button-3>", lambda event, x=x, y=y: self.controller.toggle_flag(x, y))
-                button.bind("<Control-Button-1>", lambda event, x=x, y=y: self.controller.toggle_flag(x, y))
+        self._buttons = []
+        rows, cols = self.model.board_size
+        for x in range(rows):
+            for y in range(cols):
+                button = Button(self.frame, image=self.images.plain)
+                button.position = (x, y)
+                button.bind("<Button-1>", self._on_reveal)
+                button.bind("<<Flag>>", self._on_flag)
                 button.grid(row=x + 1, column=y)
-                cell.button = button
+                self._buttons.append(button)
         self.labels["mines"].config(text=f"Mines: {self.model.mines_count}")
 
+    def _on_reveal(self, event):
+        """
+        Dispatches a reveal click on a board button to the controller.
+        
+        Precondition:
+            - event.widget must be a board button created by setup_board
+        Postcondition:
+            - Controller reveals the cell at the button's position
+        Invariant:
+            - Button positions match model board coordinates
+        
+        Maps to: onClick() binding in original minesweeper.py
+        """
+        self.controller.reveal_cell(*event.widget.position)
+
+    def _on_flag(self, event):
+        """
+        Dispatches a flag click on a board button to the controller.
+        
+        Precondition:
+            - event.widget must be a board button created by setup_board
+        Postcondition:
+            - Controller toggles the flag at the button's position
+        Invariant:
+            - Button positions match model board coordinates
+        
+        Maps to: onRightClick() binding in original minesweeper.py
+        """
+        self.controller.toggle_flag(*event.widget.position)
+
     def update_cell(self, x, y):
         """
         Updates the GUI for a single cell.
@@ -106,20 +196,41 @@ class GUIView:
         
         Maps to: onClick() and onRightClick() cell updates in original minesweeper.py
         """
-        cell = self.model.board[x][y]
-        if cell.is_revealed:
-            if cell.is_mine:
-                cell.button.config(image=self.images["mine"])
-            elif cell.has_treasure:
-                cell.button.config(image=self.images["treasure"])
-            elif cell.adjacent_mines > 0:
-                cell.button.config(image=self.images["numbers"][cell.adjacent_mines - 1])
+        index = x * self.model.board_size[1] + y
+        cell_state = self.model.state[index]
+        button = self._buttons[index]
+        images = self.images
+        if cell_state & REVEAL:
+            adjacent_mines = self.model.adjacent_mines[index]
+            if cell_state & MINE:
+                button.config(image=images.mine)
+            elif cell_state & TREASURE:
+                button.config(image=images.treasure)
+            elif adjacent_mines > 0:
+                button.config(image=getattr(images, _NUMBER_IMAGES[adjacent_mines]))
             else:
-                cell.button.config(image=self.images["clicked"])
-        elif cell.is_flagged:
-            cell.button.config(image=self.images["flag"])
+                button.config(image=images.clicked)
+        elif cell_state & FLAG:
+            button.config(image=images.flag)
         else:
-            cell.button.config(image=self.images["plain"])
+            button.config(image=images.plain)
+
+    def update_cells(self, coords):
+        """
+        Updates the GUI for a batch of cells in a single pass.
+        
+        Precondition:
+            - coords must be an iterable of valid (x, y) board coordinates
+            - All images must be loaded
+        Postcondition:
+            - Every listed cell button displays the correct image
+        Invariant:
+            - Button states match cell states in model
+        
+        Maps to: clearSurroundingTiles() tile updates in original minesweeper.py
+        """
+        for x, y in coords:
+            self.update_cell(x, y)
 
     def display_game_over(self, won):
         """
@@ -139,22 +250,23 @@ class GUIView:
         """
         self.stop_timer()
 
-        for row in self.model.board:
-            for cell in row:
-                if cell.is_mine and not cell.is_flagged:
-                    cell.button.config(image=self.images["mine"])
-                elif not cell.is_mine and cell.is_flagged:
-                    cell.button.config(image=self.images["wrong"])
-                elif cell.has_treasure:
-                    cell.button.config(image=self.images["treasure"])
+        # Only cells whose image changes are touched, and the relayout is
+        # forced once after all of them are configured.
+        images = self.images
+        for button, cell_state in zip(self._buttons, self.model.state):
+            if cell_state & MINE and not cell_state & FLAG:
+                button.config(image=images.mine)
+            elif not cell_state & MINE and cell_state & FLAG:
+                button.config(image=images.wrong)
+            elif cell_state & TREASURE:
+                button.config(image=images.treasure)
+        self.frame.update_idletasks()
 
         message = "You found a treasure! 💰 You have won the Game!" if won == "WIN_TREASURE" else "You Win!" if won else "You Lose! 💣"
 
         if messagebox.askyesno("Game Over", f"{message} Play again?"):
-            for row in self.model.board:
-                for cell in row:
-                    if hasattr(cell, 'button'):
-                        cell.button.destroy()
+            for button in self._buttons:
+                button.destroy()
             
             self.frame.destroy()
             self.frame = Frame(self.tk)
@@ -169,9 +281,8 @@ class GUIView:
             self.labels["mines"].grid(row=self.model.board_size[0] + 1, column=0, columnspan=4)
             self.labels["flags"].grid(row=self.model.board_size[0] + 1, column=4, columnspan=4)
             
+            # restart_game rebuilds the board buttons and restarts the timer.
             self.controller.restart_game()
-            self.setup_board()
-            self.start_timer()
         else:
             self.tk.quit()
 
@@ -241,11 +352,11 @@ class GUIView:
         
         Maps to: updateTimer() in original minesweeper.py
         """
-        if self.model.start_time and self.timer_running:
-            from datetime import datetime
-            elapsed_time = datetime.now() - self.model.start_time
-            time_str = str(elapsed_time).split('.')[0]
-            self.labels["time"].config(text=time_str)
+        if self.model.start_time is not None and self.timer_running:
+            seconds = int(monotonic() - self.model.start_time)
+            hours, seconds = divmod(seconds, 3600)
+            minutes, seconds = divmod(seconds, 60)
+            self.labels["time"].config(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
 
         if self.timer_running:
             self.tk.after(1000, self.update_timer)
\ No newline at end of file
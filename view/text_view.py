@@ -1,3 +1,71 @@
+import sys
+
+from model.game_model import MINE, FLAG, REVEAL, TREASURE
+
+
+def _board_symbol(cell_state, adjacent_mines):
+    """
+    Returns the board symbol for a packed cell state and adjacent mine count.
+    
+    Precondition:
+        - cell_state must be a packed GameModel state byte
+        - adjacent_mines must be between 0 and 8
+    Postcondition:
+        - Returns the single character shown for the cell in display_board
+    Invariant:
+        - Flags take precedence over every revealed symbol
+    """
+    if cell_state & FLAG:
+        return "F"
+    if not cell_state & REVEAL:
+        return "."
+    if cell_state & MINE:
+        return "*"
+    if cell_state & TREASURE:
+        return "T"
+    if adjacent_mines > 0:
+        return str(adjacent_mines)
+    return " "
+
+
+def _final_symbol(cell_state, adjacent_mines):
+    """
+    Returns the two-column symbol shown for a cell on the final game over board.
+    
+    Precondition:
+        - cell_state must be a packed GameModel state byte
+        - adjacent_mines must be between 0 and 8
+    Postcondition:
+        - Returns the padded symbol shown for the cell in display_game_over
+    Invariant:
+        - Mines and flags take precedence over treasures and counts
+    """
+    if cell_state & MINE and cell_state & FLAG:
+        return "F " # correclty flagged
+    if cell_state & MINE:
+        return "* " # revealed mine
+    if cell_state & FLAG:
+        return "X " # Wrong flag
+    if cell_state & TREASURE:
+        return "T " # Treasure
+    if adjacent_mines > 0:
+        return f"{adjacent_mines} "
+    return "  " # Empty cell
+
+
+# Symbols for every (state, adjacent mines) pair, indexed by state * 9 + adjacent.
+_BOARD_SYMBOLS = tuple(
+    _board_symbol(cell_state, adjacent_mines)
+    for cell_state in range(16)
+    for adjacent_mines in range(9)
+)
+_FINAL_SYMBOLS = tuple(
+    _final_symbol(cell_state, adjacent_mines)
+    for cell_state in range(16)
+    for adjacent_mines in range(9)
+)
+
+
 class TextView:
     """
     Text-based view implementation for Minesweeper game.
@@ -37,29 +105,28 @@ class TextView:
         
         Maps to: setup() board display in original minesweeper.py
         """
-        print("\nMinesweeper - Text View")
-        print(f"Number of Mines: {self.model.mines_count}")
-        print(f"Number of flags used: {self.model.flags_count}")
-        
-        print("    " + " ".join(f"{y:2}" for y in range(self.model.board_size[1])))
-        
-        for x, row in enumerate(self.model.board):
-            row_display = [f"{x:2}  "]
-            for cell in row:
-                if not cell.is_revealed and not cell.is_flagged:
-                    row_display.append(".")
-                elif cell.is_flagged:
-                    row_display.append("F")
-                elif cell.is_mine:
-                    row_display.append("*")
-                elif cell.has_treasure:
-                    row_display.append("T")
-                elif cell.adjacent_mines > 0:
-                    row_display.append(str(cell.adjacent_mines))
-                else:
-                    row_display.append(" ")
-            print(" ".join(f"{item:2}" for item in row_display))
-        print()
+        rows, cols = self.model.board_size
+        out = [
+            "",
+            "Minesweeper - Text View",
+            f"Number of Mines: {self.model.mines_count}",
+            f"Number of flags used: {self.model.flags_count}",
+            "    " + " ".join(f"{y:2}" for y in range(cols)),
+        ]
+
+        # Every symbol is one character wide, so padding each to two columns
+        # and joining with a space is the same as joining with two spaces.
+        state = self.model.state
+        adjacent = self.model.adjacent_mines
+        for x in range(rows):
+            start = x * cols
+            symbols = [
+                _BOARD_SYMBOLS[cell_state * 9 + adjacent_mines]
+                for cell_state, adjacent_mines in zip(state[start:start + cols], adjacent[start:start + cols])
+            ]
+            out.append(f"{x:2}   " + "  ".join(symbols) + " ")
+
+        sys.stdout.write("\n".join(out) + "\n\n")
 
     def run(self):
         """
@@ -75,15 +142,21 @@ class TextView:
         
         Maps to: mainloop() in original minesweeper.py
         """
+        # The full board is drawn once; after that each move only prints
+        # the cells it changed (via update_cells) until 'b' is entered.
+        self.display_board()
         while True:
-            self.display_board()
             print("\nEnter your move (row col action):")
-            print("Actions: r(reveal), f(flag), q(quit)")
+            print("Actions: r(reveal), f(flag), q(quit), b(show board)")
             move = input("Move: ").strip().lower().split()
             
             if len(move) == 1 and move[0] == 'q':
                 print("Thank you for playing!")
                 return
+
+            if len(move) == 1 and move[0] == 'b':
+                self.display_board()
+                continue
                 
             if len(move) != 3:
                 print("Invalid input. Please enter row, column, and action (reveal/flag).")
@@ -99,13 +172,8 @@ class TextView:
                     continue
                     
                 if action == "r":
-                    result = self.controller.reveal_cell(x, y)
-                    if result == "LOSS":
-                        self.display_game_over(False)
-                        return
-                    elif result in ["WIN", "WIN_TREASURE"]:
-                        self.display_game_over(True, result == "WIN_TREASURE")
-                        return
+                    if not self.controller.reveal_cell(x, y):
+                        print("No cells changed.")
                 elif action == "f":
                     self.controller.toggle_flag(x, y)
                 else:
@@ -154,24 +222,39 @@ class TextView:
             - x and y must be valid board coordinates
             - Cell at (x,y) must exist
         Postcondition:
-            - Cell display is updated according to its state
+            - Cell coordinates and current board symbol are displayed
         Invariant:
             - Display matches cell state in model
         
         Maps to: onClick() and onRightClick() cell updates in original minesweeper.py
         """
-        cell = self.model.board[x][y]
-        if cell.is_revealed:
-            if cell.is_mine:
-                print("*")
-            elif cell.has_treasure:
-                print("T")
-            else:
-                pass
-        elif cell.is_flagged:
-            print("F")
-        else:
-            print(".")
+        index = x * self.model.board_size[1] + y
+        symbol = _BOARD_SYMBOLS[self.model.state[index] * 9 + self.model.adjacent_mines[index]]
+        print(f"({x}, {y}): {symbol}")
+
+    def update_cells(self, coords):
+        """
+        Updates the view for a batch of cells.
+        Small batches are printed cell by cell; a batch larger than one
+        line per board row is cheaper to show as the full board.
+        
+        Precondition:
+            - coords must be an iterable of valid (x, y) board coordinates
+        Postcondition:
+            - Every listed cell display is updated according to its state
+        Invariant:
+            - Display matches cell states in model
+        
+        Maps to: clearSurroundingTiles() tile updates in original minesweeper.py
+        """
+        coords = sorted(coords)
+        if len(coords) > self.model.board_size[0]:
+            self.display_board()
+            return
+
+        print("Changed cells:")
+        for x, y in coords:
+            self.update_cell(x, y)
 
     def display_game_over(self, won, found_treasure=False):
         """
@@ -205,21 +288,16 @@ class TextView:
             print(f"{i:2}", end=" ")
         print()
 
-        for x, row in enumerate(self.model.board):
+        rows, cols = self.model.board_size
+        state = self.model.state
+        adjacent = self.model.adjacent_mines
+        for x in range(rows):
+            start = x * cols
             row_display = [f"{x:2}  "]
-            for cell in row:
-                if cell.is_mine and cell.is_flagged:
-                    row_display.append("F ") # correclty flagged
-                elif cell.is_mine:
-                    row_display.append("* ") # revealed mine
-                elif not cell.is_mine and cell.is_flagged:
-                    row_display.append("X ") # Wrong flag
-                elif cell.has_treasure:
-                    row_display.append("T ") # Treasure
-                elif cell.adjacent_mines > 0:
-                    row_display.append(f"{cell.adjacent_mines} ")
-                else:
-                    row_display.append("  ") # Empty cell
+            row_display.extend(
+                _FINAL_SYMBOLS[cell_state * 9 + adjacent_mines]
+                for cell_state, adjacent_mines in zip(state[start:start + cols], adjacent[start:start + cols])
+            )
             print(" ".join(row_display))
         print()
 